@@ -29,25 +29,32 @@ DEBUG_API = False
 import os
 
 # type handling, fastapi leverages type checking for performance and easy docs
-from typing import List, Dict, Set, Any, Optional, Callable, Union, TYPE_CHECKING, get_type_hints
+from typing import List, Dict, Set, Tuple, Any, Optional, Callable, Union, TYPE_CHECKING, get_type_hints
+from typing_extensions import Final
 from types import SimpleNamespace
 
 import urllib.request # For custom album art size
 from queue import Queue
 from functools import lru_cache
+from weakref import WeakKeyDictionary
 import asyncio
-import json
 import yaml
+import orjson
 from time import sleep
 
 from PIL import Image # For custom album art size
 
 # web framework
-from fastapi import FastAPI, Request, Response, HTTPException, Depends, Path
+from fastapi import FastAPI, Request, Response, HTTPException, Depends, Path, Query
 from fastapi.openapi.utils import get_openapi # docs
+import fastapi.dependencies.utils as fastapi_dep_utils
 from fastapi.staticfiles import StaticFiles
 from fastapi.routing import APIRoute, APIRouter
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic_core import to_json
 from starlette.responses import FileResponse
 from sse_starlette.sse import EventSourceResponse
 
@@ -67,13 +74,47 @@ TEMPLATE_DIR = os.path.abspath('web/templates')
 STATIC_DIR = os.path.abspath('web/static')
 GENERATED_DIR = os.path.abspath('web/generated')
 
+class SelectiveGZipMiddleware(GZipMiddleware):
+  """ Compress responses, except for media that is already compressed (images, audio and fonts)
+
+  Compressing these again would only cost CPU time on the pi
+  """
+  COMPRESSED_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.mp3', '.woff', '.woff2')
+
+  async def __call__(self, scope, receive, send) -> None:
+    path: str = scope.get('path', '')
+    if path.endswith(self.COMPRESSED_EXTS) or '/image/' in path: # album art images are served from /api/sources/{sid}/image/{height}
+      await self.app(scope, receive, send)
+    else:
+      await super().__call__(scope, receive, send)
+
 app = FastAPI(openapi_url=None, redoc_url=None,) # we host docs using rapidoc instead via a custom endpoint, so the default endpoints need to be disabled
-templates = Jinja2Templates(TEMPLATE_DIR)
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5) # the status and docs responses are large, level 5 is nearly as small as 9 for a fraction of the CPU
+# the templates only change on updates, so don't check them for changes on every render and cache their compiled form between restarts
+templates = Jinja2Templates(TEMPLATE_DIR, auto_reload=False, bytecode_cache=FileSystemBytecodeCache())
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 app.mount("/generated", StaticFiles(directory=GENERATED_DIR), name="generated") # TODO: make this register as a dynamic folder???
 
 
+def _memoize_per_callable(inspector: Callable[[Callable[..., Any]], Any]) -> Callable[[Callable[..., Any]], Any]:
+  """ Memoize the result of introspecting a callable, keyed weakly on the callable """
+  cache: 'WeakKeyDictionary[Callable[..., Any], Any]' = WeakKeyDictionary()
+  def memoized(call: Callable[..., Any]) -> Any:
+    try:
+      return cache[call]
+    except KeyError:
+      result = cache[call] = inspector(call)
+      return result
+    except TypeError: # not weakly referenceable, inspect it every time
+      return inspector(call)
+  return memoized
+
+# When solving dependencies, FastAPI checks how to call each one (ie. get_ctrl) on every request, these results never change
+for _inspector in ['is_coroutine_callable', 'is_gen_callable', 'is_async_gen_callable']:
+  if hasattr(fastapi_dep_utils, _inspector): # some of these have been moved in newer versions of FastAPI
+    setattr(fastapi_dep_utils, _inspector, _memoize_per_callable(getattr(fastapi_dep_utils, _inspector)))
+
 class SimplifyingRouter(APIRouter):
   """
   Overrides the route decorator logic to:
@@ -87,31 +128,51 @@ class SimplifyingRouter(APIRouter):
       kwargs["response_model_exclude_none"] = True
       return super().add_api_route(path, endpoint, **kwargs)
 
+class PydanticResponse(JSONResponse):
+  """ Serialize pydantic models directly with pydantic-core, matching the exclude_none behavior of the routes
+
+  Returning one of these from a route skips FastAPI's jsonable_encoder, response model re-validation and stdlib json encoding.
+  The route's response_model is still used to generate its documentation.
+  """
+  def render(self, content: Any) -> bytes:
+    return to_json(content, exclude_none=True)
+
 # Helper functions
-def unused_groups(ctrl: Api, src: int) -> Dict[int, str]:
-  """ Get groups that are not connected to src """
-  groups = ctrl.status.groups
-  return {g.id : g.name for g in groups if g.source_id != src and g.id  is not None}
-
-def unused_zones(ctrl: Api, src: int) -> Dict[int, str]:
-  """ Get zones that are not conencted to src """
-  zones = ctrl.status.zones
-  return {z.id : z.name for z in zones if z.source_id != src and z.id is not None}
-
-def ungrouped_zones(ctrl: Api, src: int) -> List[models.Zone]:
-  """ Get zones that are connected to src, but don't belong to a full group """
-  zones = ctrl.status.zones
-  groups = ctrl.status.groups
-  # get all of the zones that belong to this sources groups
-  grouped_zones: Set[int] = set()
-  for group in groups:
-    if group.source_id == src:
-      grouped_zones = grouped_zones.union(group.zones)
-  # get all of the zones connected to this soource
-  source_zones = {z.id for z in zones if z.source_id == src}
-  # return all of the zones connected to this source that aren't in a group
-  ungrouped_zones_ = source_zones.difference(grouped_zones)
-  return [zones[z] for z in ungrouped_zones_ if z is not None and not zones[z].disabled]
+def _view_state(state: models.Status) -> Dict[str, List[Any]]:
+  """ Get the per-source collections used by the webapp's view, walking the zones and groups only once
+
+  Returns a dictionary with lists of each of these, indexed by source:
+    unused_groups: groups that are not connected to the source
+    unused_zones: zones that are not connected to the source
+    ungrouped_zones: zones that are connected to the source, but don't belong to a full group
+    song_info: the source's song info
+  """
+  sids = [src.id for src in state.sources if src.id is not None]
+  unused_groups: List[Dict[int, str]] = [{} for _ in sids]
+  unused_zones: List[Dict[int, str]] = [{} for _ in sids]
+  grouped_zones: List[Set[int]] = [set() for _ in sids]
+  source_zones: List[List[models.Zone]] = [[] for _ in sids]
+  for group in state.groups:
+    for i, sid in enumerate(sids):
+      if group.source_id == sid:
+        grouped_zones[i].update(group.zones)
+      elif group.id is not None:
+        unused_groups[i][group.id] = group.name
+  for zone in state.zones:
+    if zone.id is None:
+      continue
+    for i, sid in enumerate(sids):
+      if zone.source_id == sid:
+        if not zone.disabled:
+          source_zones[i].append(zone)
+      else:
+        unused_zones[i][zone.id] = zone.name
+  return {
+    'unused_groups': unused_groups,
+    'unused_zones': unused_zones,
+    'ungrouped_zones': [[z for z in zones if z.id not in grouped_zones[i]] for i, zones in enumerate(source_zones)],
+    'song_info': [src.info for src in state.sources if src.info is not None], # src.info should never be None
+  }
 
 # add a default controller (this is overriden below in create_app)
 @lru_cache(1) # Api controller should only be instantiated once (we clear the cache with get_ctr.cache_clear() after settings object is configured)
@@ -121,25 +182,40 @@ def get_ctrl() -> Api:
   """
   return Api(models.AppSettings())
 
+async def get_ctrl_async() -> Api:
+  """ Get the controller
+
+  Resolving this dependency is trivial, as an async function it is done on the event loop instead of being dispatched to the threadpool
+  """
+  return get_ctrl()
+
 class params(SimpleNamespace):
-  """ Describe standard path ID's for each api type """
+  """ Describe standard path ID's for each api type
+
+  These are shared by every route using them, FastAPI only reads them when the routes are registered
+  """
   # pylint: disable=too-few-public-methods
   # pylint: disable=invalid-name
-  SourceID = Path(..., ge=0, le=3, description="Source ID")
-  ZoneID = Path(..., ge=0, le=35, description="Zone ID")
-  GroupID = Path(..., ge=0, description="Stream ID")
-  StreamID = Path(..., ge=0, description="Stream ID")
-  StreamCommand = Path(..., description="Stream Command")
-  PresetID = Path(..., ge=0, description="Preset ID")
-  StationID = Path(..., ge=0, title="Pandora Station ID", description="Number found on the end of a pandora url while playing the station, ie 4610303469018478727 in https://www.pandora.com/station/play/4610303469018478727")
-  ImageHeight = Path(..., ge=1, le=500, description="Image Height in pixels")
+  SourceID: Final = Path(..., ge=0, le=3, description="Source ID")
+  ZoneID: Final = Path(..., ge=0, le=35, description="Zone ID")
+  GroupID: Final = Path(..., ge=0, description="Stream ID")
+  StreamID: Final = Path(..., ge=0, description="Stream ID")
+  StreamCommand: Final = Path(..., description="Stream Command")
+  PresetID: Final = Path(..., ge=0, description="Preset ID")
+  StationID: Final = Path(..., ge=0, title="Pandora Station ID", description="Number found on the end of a pandora url while playing the station, ie 4610303469018478727 in https://www.pandora.com/station/play/4610303469018478727")
+  ImageHeight: Final = Path(..., ge=1, le=500, description="Image Height in pixels")
+  Echo: Final = Query(True, description="Respond with the updated system status, set to false to get an empty response (204 No Content) instead")
 
 api = SimplifyingRouter()
 
-@api.get('/api', tags=['status'])
-def get_status(ctrl: Api = Depends(get_ctrl)) -> models.Status:
+@api.get('/api', tags=['status'], response_model=models.Status)
+def get_status(request: Request, ctrl: Api = Depends(get_ctrl_async)) -> Response:
   """ Get the system status and configuration """
-  return ctrl.get_state()
+  # let pollers skip downloading and parsing a status they already have
+  content, etag = ctrl.get_state_json()
+  if request.headers.get('if-none-match') == etag:
+    return Response(status_code=304, headers={'ETag': etag})
+  return Response(content, media_type='application/json', headers={'ETag': etag})
 
 @api.post('/api/load', tags=['status'])
 def load_config(config: models.Status, ctrl: Api = Depends(get_ctrl)) -> models.Status:
@@ -182,33 +258,38 @@ async def subscribe(req: Request):
       raise exc
   return EventSourceResponse(stream())
 
-def code_response(ctrl: Api, resp: Union[ApiResponse, models.BaseModel]):
-  """ Convert amplipi.ctrl.Api responses to json/http responses """
+def code_response(ctrl: Api, resp: Union[ApiResponse, models.BaseModel], echo: bool = True):
+  """ Convert amplipi.ctrl.Api responses to json/http responses
+
+  The system status is only serialized and returned on success if echo is set
+  """
   if isinstance(resp, ApiResponse):
     if resp.code == ApiCode.OK:
       # general commands return None to indicate success
+      if not echo:
+        return Response(status_code=204)
       return ctrl.get_state()
     # TODO: refine error codes based on error message
     raise HTTPException(404, resp.msg)
   return resp
 
 # sources
-@api.get('/api/sources', tags=['source'])
-def get_sources(ctrl: Api = Depends(get_ctrl)) -> Dict[str, List[models.Source]]:
+@api.get('/api/sources', tags=['source'], response_model=Dict[str, List[models.Source]])
+def get_sources(ctrl: Api = Depends(get_ctrl_async)) -> Response:
   """ Get all sources """
-  return {'sources' : ctrl.get_state().sources}
+  return Response(ctrl.get_sources_json(), media_type='application/json')
 
-@api.get('/api/sources/{sid}', tags=['source'])
-def get_source(ctrl: Api = Depends(get_ctrl), sid: int = params.SourceID) -> models.Source:
+@api.get('/api/sources/{sid}', tags=['source'], response_model=models.Source)
+def get_source(ctrl: Api = Depends(get_ctrl_async), sid: int = params.SourceID) -> Response:
   """ Get Source with id=**sid** """
   # TODO: add get_X capabilities to underlying API?
   sources = ctrl.get_state().sources
-  return sources[sid]
+  return PydanticResponse(sources[sid])
 
 @api.patch('/api/sources/{sid}', tags=['source'])
-def set_source(update: models.SourceUpdate, ctrl: Api = Depends(get_ctrl), sid: int = params.SourceID) -> models.Status:
+def set_source(update: models.SourceUpdate, ctrl: Api = Depends(get_ctrl), sid: int = params.SourceID, echo: bool = params.Echo) -> models.Status:
   """ Update a source's configuration (source=**sid**) """
-  return code_response(ctrl, ctrl.set_source(sid, update))
+  return code_response(ctrl, ctrl.set_source(sid, update), echo=echo)
 
 @api.get('/api/sources/{sid}/image/{height}', tags=['source'],
   # Manually specify a possible response
@@ -259,28 +340,28 @@ async def get_image(ctrl: Api = Depends(get_ctrl), sid: int = params.SourceID, h
 
 # zones
 
-@api.get('/api/zones', tags=['zone'])
-def get_zones(ctrl: Api = Depends(get_ctrl)) -> Dict[str, List[models.Zone]]:
+@api.get('/api/zones', tags=['zone'], response_model=Dict[str, List[models.Zone]])
+def get_zones(ctrl: Api = Depends(get_ctrl_async)) -> Response:
   """ Get all zones """
-  return {'zones': ctrl.get_state().zones}
+  return Response(ctrl.get_zones_json(), media_type='application/json')
 
-@api.get('/api/zones/{zid}', tags=['zone'])
-def get_zone(ctrl: Api = Depends(get_ctrl), zid: int = params.ZoneID) -> models.Zone:
+@api.get('/api/zones/{zid}', tags=['zone'], response_model=models.Zone)
+def get_zone(ctrl: Api = Depends(get_ctrl_async), zid: int = params.ZoneID) -> Response:
   """ Get Zone with id=**zid** """
   zones = ctrl.get_state().zones
   if 0 <= zid < len(zones):
-    return zones[zid]
+    return PydanticResponse(zones[zid])
   raise HTTPException(404, f'zone {zid} not found')
 
 @api.patch('/api/zones/{zid}', tags=['zone'])
-def set_zone(zone: models.ZoneUpdate, ctrl: Api = Depends(get_ctrl), zid: int = params.ZoneID) -> models.Status:
+def set_zone(zone: models.ZoneUpdate, ctrl: Api = Depends(get_ctrl), zid: int = params.ZoneID, echo: bool = params.Echo) -> models.Status:
   """ Update a zone's configuration (zone=**zid**) """
-  return code_response(ctrl, ctrl.set_zone(zid, zone))
+  return code_response(ctrl, ctrl.set_zone(zid, zone), echo=echo)
 
 @api.patch('/api/zones', tags=['zone'])
-def set_zones(multi_update: models.MultiZoneUpdate, ctrl: Api = Depends(get_ctrl)) -> models.Status:
+def set_zones(multi_update: models.MultiZoneUpdate, ctrl: Api = Depends(get_ctrl), echo: bool = params.Echo) -> models.Status:
   """ Update a bunch of zones (and groups) with the same configuration changes """
-  return code_response(ctrl, ctrl.set_zones(multi_update))
+  return code_response(ctrl, ctrl.set_zones(multi_update), echo=echo)
 
 # groups
 
@@ -290,28 +371,28 @@ def create_group(group: models.Group, ctrl: Api = Depends(get_ctrl)) -> models.G
   # TODO: add named example group
   return code_response(ctrl, ctrl.create_group(group))
 
-@api.get('/api/groups', tags=['group'])
-def get_groups(ctrl: Api = Depends(get_ctrl)) -> Dict[str, List[models.Group]]:
+@api.get('/api/groups', tags=['group'], response_model=Dict[str, List[models.Group]])
+def get_groups(ctrl: Api = Depends(get_ctrl_async)) -> Response:
   """ Get all groups """
-  return {'groups' : ctrl.get_state().groups}
+  return Response(ctrl.get_groups_json(), media_type='application/json')
 
-@api.get('/api/groups/{gid}', tags=['group'])
-def get_group(ctrl: Api = Depends(get_ctrl), gid: int = params.GroupID) -> models.Group:
+@api.get('/api/groups/{gid}', tags=['group'], response_model=models.Group)
+def get_group(ctrl: Api = Depends(get_ctrl_async), gid: int = params.GroupID) -> Response:
   """ Get Group with id=**gid** """
-  _, grp = utils.find(ctrl.get_state().groups, gid)
+  grp = ctrl.get_group_by_id(gid)
   if grp is not None:
-    return grp
+    return PydanticResponse(grp)
   raise HTTPException(404, f'group {gid} not found')
 
 @api.patch('/api/groups/{gid}', tags=['group'])
-def set_group(group: models.GroupUpdate, ctrl: Api = Depends(get_ctrl), gid: int = params.GroupID) -> models.Status:
+def set_group(group: models.GroupUpdate, ctrl: Api = Depends(get_ctrl), gid: int = params.GroupID, echo: bool = params.Echo) -> models.Status:
   """ Update a groups's configuration (group=**gid**) """
-  return code_response(ctrl, ctrl.set_group(gid, group))
+  return code_response(ctrl, ctrl.set_group(gid, group), echo=echo)
 
 @api.delete('/api/groups/{gid}', tags=['group'])
-def delete_group(ctrl: Api = Depends(get_ctrl), gid: int = params.GroupID) -> models.Status:
+def delete_group(ctrl: Api = Depends(get_ctrl), gid: int = params.GroupID, echo: bool = params.Echo) -> models.Status:
   """ Delete a group (group=**gid**) """
-  return code_response(ctrl, ctrl.delete_group(gid))
+  return code_response(ctrl, ctrl.delete_group(gid), echo=echo)
 
 # streams
 
@@ -322,37 +403,37 @@ def create_stream(stream: models.Stream, ctrl: Api = Depends(get_ctrl)) -> model
   """
   return code_response(ctrl, ctrl.create_stream(stream))
 
-@api.get('/api/streams', tags=['stream'])
-def get_streams(ctrl: Api = Depends(get_ctrl)) -> Dict[str, List[models.Stream]]:
+@api.get('/api/streams', tags=['stream'], response_model=Dict[str, List[models.Stream]])
+def get_streams(ctrl: Api = Depends(get_ctrl_async)) -> Response:
   """ Get all streams """
-  return {'streams' : ctrl.get_state().streams}
+  return Response(ctrl.get_streams_json(), media_type='application/json')
 
-@api.get('/api/streams/{sid}', tags=['stream'])
-def get_stream(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID) -> models.Stream:
+@api.get('/api/streams/{sid}', tags=['stream'], response_model=models.Stream)
+def get_stream(ctrl: Api = Depends(get_ctrl_async), sid: int = params.StreamID) -> Response:
   """ Get Stream with id=**sid** """
-  _, stream = utils.find(ctrl.get_state().streams, sid)
+  stream = ctrl.get_stream_by_id(sid)
   if stream is not None:
-    return stream
+    return PydanticResponse(stream)
   raise HTTPException(404, f'stream {sid} not found')
 
 @api.patch('/api/streams/{sid}', tags=['stream'])
-def set_stream(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, update: models.StreamUpdate = None) -> models.Status:
+def set_stream(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, update: models.StreamUpdate = None, echo: bool = params.Echo) -> models.Status:
   """ Update a stream's configuration (stream=**sid**) """
-  return code_response(ctrl, ctrl.set_stream(sid, update))
+  return code_response(ctrl, ctrl.set_stream(sid, update), echo=echo)
 
 @api.delete('/api/streams/{sid}', tags=['stream'])
-def delete_stream(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID) -> models.Status:
+def delete_stream(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, echo: bool = params.Echo) -> models.Status:
   """ Delete a stream """
-  return code_response(ctrl, ctrl.delete_stream(sid))
+  return code_response(ctrl, ctrl.delete_stream(sid), echo=echo)
 
 @api.post('/api/streams/{sid}/station={station}', tags=['stream'])
-def change_station(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, station: int = params.StationID) -> models.Status:
+def change_station(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, station: int = params.StationID, echo: bool = params.Echo) -> models.Status:
   """ Change station on a pandora stream (stream=**sid**) """
   # This is a specific version of exec command, it needs to be placed before the genertic version so the path is resolved properly
-  return code_response(ctrl, ctrl.exec_stream_command(sid, cmd=f'station={station}'))
+  return code_response(ctrl, ctrl.exec_stream_command(sid, cmd=f'station={station}'), echo=echo)
 
 @api.post('/api/streams/{sid}/{cmd}', tags=['stream'])
-def exec_command(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, cmd: models.StreamCommand = None) -> models.Status:
+def exec_command(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, cmd: models.StreamCommand = None, echo: bool = params.Echo) -> models.Status:
   """ Executes a comamnd on a stream (stream=**sid**).
 
     Command options:
@@ -365,7 +446,7 @@ def exec_command(ctrl: Api = Depends(get_ctrl), sid: int = params.StreamID, cmd:
     * Shelve Current Song (pandora only): **shelve**
 
   Currently only available with Pandora streams"""
-  return code_response(ctrl, ctrl.exec_stream_command(sid, cmd=cmd))
+  return code_response(ctrl, ctrl.exec_stream_command(sid, cmd=cmd), echo=echo)
 
 # presets
 
@@ -374,40 +455,40 @@ def create_preset(preset: models.Preset, ctrl: Api = Depends(get_ctrl)) -> model
   """ Create a new preset configuration """
   return code_response(ctrl, ctrl.create_preset(preset))
 
-@api.get('/api/presets', tags=['preset'])
-def get_presets(ctrl: Api = Depends(get_ctrl)) -> Dict[str, List[models.Preset]]:
+@api.get('/api/presets', tags=['preset'], response_model=Dict[str, List[models.Preset]])
+def get_presets(ctrl: Api = Depends(get_ctrl_async)) -> Response:
   """ Get all presets """
-  return {'presets' : ctrl.get_state().presets}
+  return Response(ctrl.get_presets_json(), media_type='application/json')
 
-@api.get('/api/presets/{pid}', tags=['preset'])
-def get_preset(ctrl: Api = Depends(get_ctrl), pid: int = params.PresetID) -> models.Preset:
+@api.get('/api/presets/{pid}', tags=['preset'], response_model=models.Preset)
+def get_preset(ctrl: Api = Depends(get_ctrl_async), pid: int = params.PresetID) -> Response:
   """ Get Preset with id=**pid** """
-  _, preset = utils.find(ctrl.get_state().presets, pid)
+  preset = ctrl.get_preset_by_id(pid)
   if preset is not None:
-    return preset
+    return PydanticResponse(preset)
   raise HTTPException(404, f'preset {pid} not found')
 
 @api.patch('/api/presets/{pid}', tags=['preset'])
-def set_preset(ctrl: Api = Depends(get_ctrl), pid: int = params.PresetID, update: models.PresetUpdate = None) -> models.Status:
+def set_preset(ctrl: Api = Depends(get_ctrl), pid: int = params.PresetID, update: models.PresetUpdate = None, echo: bool = params.Echo) -> models.Status:
   """ Update a preset's configuration (preset=**pid**) """
-  return code_response(ctrl, ctrl.set_preset(pid, update))
+  return code_response(ctrl, ctrl.set_preset(pid, update), echo=echo)
 
 @api.delete('/api/presets/{pid}', tags=['preset'])
-def delete_preset(ctrl: Api = Depends(get_ctrl), pid: int = params.PresetID) -> models.Status:
+def delete_preset(ctrl: Api = Depends(get_ctrl), pid: int = params.PresetID, echo: bool = params.Echo) -> models.Status:
   """ Delete a preset """
-  return code_response(ctrl, ctrl.delete_preset(pid))
+  return code_response(ctrl, ctrl.delete_preset(pid), echo=echo)
 
 @api.post('/api/presets/{pid}/load', tags=['preset'])
-def load_preset(ctrl: Api = Depends(get_ctrl), pid: int = params.PresetID) -> models.Status:
+def load_preset(ctrl: Api = Depends(get_ctrl), pid: int = params.PresetID, echo: bool = params.Echo) -> models.Status:
   """ Load a preset configuration """
-  return code_response(ctrl, ctrl.load_preset(pid))
+  return code_response(ctrl, ctrl.load_preset(pid), echo=echo)
 
 # PA
 
 @api.post('/api/announce', tags=['announce'])
-def announce(announcement: models.Announcement, ctrl: Api = Depends(get_ctrl)) -> models.Status:
+def announce(announcement: models.Announcement, ctrl: Api = Depends(get_ctrl), echo: bool = params.Echo) -> models.Status:
   """ Make an announcement """
-  return code_response(ctrl, ctrl.announce(announcement))
+  return code_response(ctrl, ctrl.announce(announcement), echo=echo)
 
 # include all routes above
 
@@ -419,8 +500,7 @@ def get_body_model(route: APIRoute) -> Optional[Dict[str, Any]]:
   """ Get json model for the body of an api request """
   try:
     if route.body_field:
-      json_model = route.body_field.type_.schema_json()
-      return json.loads(json_model)
+      return route.body_field.type_.model_json_schema()
     return None
   except:
     return None
@@ -429,8 +509,7 @@ def get_response_model(route: APIRoute) -> Optional[Dict[str, Any]]:
   """ Get json model for the response of an api request """
   try:
     if route.response_field:
-      json_model = route.response_field.type_.schema_json()
-      return json.loads(json_model)
+      return route.response_field.type_.model_json_schema()
     return None
   except:
     return None
@@ -438,37 +517,45 @@ def get_response_model(route: APIRoute) -> Optional[Dict[str, Any]]:
 def add_creation_examples(openapi_schema, route: APIRoute) -> None:
   """ Add creation examples for a given route (for modifying request types) """
   req_model = get_body_model(route)
-  if req_model and ('examples' in req_model or 'creation_examples' in req_model):
+  if req_model and ('openapi_examples' in req_model or 'creation_examples' in req_model):
     if 'creation_examples' in req_model: # prefer creation examples for POST request, this allows us to have different examples for get response and creation requests
       examples = req_model['creation_examples']
     else:
-      examples = req_model['examples']
+      examples = req_model['openapi_examples']
     for method in route.methods:
       # Only POST, PATCH, and PUT methods have a request body
       if method in {"POST", "PATCH", "PUT"}:
         openapi_schema['paths'][route.path][method.lower()]['requestBody'][
         'content']['application/json']['examples'] = examples
 
+def add_no_echo_response(openapi_schema, route: APIRoute) -> None:
+  """ Document the empty response of routes that only echo the system status if requested """
+  if any(param.name == 'echo' for param in route.dependant.query_params):
+    for method in route.methods:
+      openapi_schema['paths'][route.path][method.lower()]['responses']['204'] = {
+        'description': 'Successful Response, the status was not requested (echo=false)'
+      }
+
 def add_response_examples(openapi_schema, route: APIRoute) -> None:
   """ Add response examples for a given route """
   resp_model = get_response_model(route)
-  if resp_model and 'examples' in resp_model:
-    examples = resp_model['examples']
+  if resp_model and 'openapi_examples' in resp_model:
+    examples = resp_model['openapi_examples']
     for method in route.methods:
       openapi_schema['paths'][route.path][method.lower()]['responses']['200'][
         'content']['application/json']['examples'] = examples
   if route.path in ['/api/zones', '/api/groups', '/api/sources', '/api/streams', '/api/presets']:
     if 'get' in  openapi_schema['paths'][route.path]:
       piece = route.path.replace('/api/', '')
-      example_status = list(models.Status.Config.schema_extra['examples'].values())[0]['value']
+      example_status = list(models.Status.model_json_schema()['openapi_examples'].values())[0]['value']
       openapi_schema['paths'][route.path]['get']['responses']['200'][
           'content']['application/json']['example'] = {piece: example_status[piece]}
 
-def get_live_examples(tags: List[str]) -> Dict[str, Dict[str, Any]]:
+def get_live_examples(ctrl: Api, tags: List[str]) -> Dict[str, Dict[str, Any]]:
   """ Create a list of examples using the live configuration """
   live_examples = {}
   for tag in tags:
-    for i in get_ctrl().get_items(tag) or []:
+    for i in ctrl.get_items(tag) or []:
       if isinstance(i.name, str):
         if isinstance(i, models.Stream):
           live_examples[i.name] = {'value': i.id, 'summary': f'{i.name} - {i.type}'}
@@ -485,13 +572,13 @@ def get_xid_param(route):
       break
   return id_param
 
-def add_example_params(openapi_schema, route: APIRoute) -> None:
+def add_example_params(ctrl: Api, openapi_schema, route: APIRoute) -> None:
   """ Manually add relevant example parameters based on the current configuration (for paths that require parameters) """
   for method in route.methods:
     xid_param = get_xid_param(route)
     if xid_param:
       # generate examples for that id parameter
-      live_examples = get_live_examples(route.tags)
+      live_examples = get_live_examples(ctrl, route.tags)
       # find the matching parameter and add the examples to it
       path_method = openapi_schema['paths'][route.path][method.lower()]
       if 'parameters' in path_method:
@@ -550,18 +637,20 @@ def generate_openapi_spec(add_test_docs=True):
     'url':  'https://github.com/micro-nova/AmpliPi/blob/master/COPYING',
   }
 
-  # Manually add examples present in pydancticModel.schema_extra into openAPI schema
+  # Manually add examples present in pydancticModel.model_config's json_schema_extra into openAPI schema
   for route in app.routes:
     if isinstance(route, APIRoute):
       add_creation_examples(openapi_schema, route)
       add_response_examples(openapi_schema, route)
+      add_no_echo_response(openapi_schema, route)
 
   if not add_test_docs:
     return openapi_schema
 
+  ctrl = get_ctrl()
   for route in app.routes:
     if isinstance(route, APIRoute):
-      add_example_params(openapi_schema, route)
+      add_example_params(ctrl, openapi_schema, route)
 
   return openapi_schema
 
@@ -633,18 +722,32 @@ YAML_DESCRIPTION = """| # The links in the description below are tested to work
     This API is documented using the OpenAPI specification
 """
 
+class _NoAliasDumper(yaml.SafeDumper):
+  """ Dump yaml without anchors and aliases, the examples are shared between routes """
+  # pylint: disable=too-many-ancestors
+  def ignore_aliases(self, data):
+    return True
+
 @lru_cache(2)
-def create_yaml_doc(add_test_docs=True) -> str:
-  """ Create the openapi yaml schema intended for display by rapidaoc
+def create_openapi_docs(add_test_docs=True) -> Tuple[bytes, bytes]:
+  """ Create the serialized openapi json and yaml schemas, the yaml schema is intended for display by rapidoc
 
   We use yaml here for its human readability.
+  These are generated once (at startup) and reused by every request.
   """
-  openapi = app.openapi()
+  openapi = generate_openapi_spec(add_test_docs)
+  json_doc = orjson.dumps(openapi)
   # use a placeholder for the description, multiline strings weren't using block formatting
   openapi['info']['description'] = '$REPLACE_ME$'
-  yaml_s = yaml.safe_dump(openapi, sort_keys=False, allow_unicode=True)
+  yaml_s = yaml.dump(openapi, Dumper=_NoAliasDumper, sort_keys=False, allow_unicode=True)
   # fix the long description
-  return yaml_s.replace('$REPLACE_ME$', YAML_DESCRIPTION)
+  yaml_doc = yaml_s.replace('$REPLACE_ME$', YAML_DESCRIPTION).encode('utf-8')
+  return json_doc, yaml_doc
+
+@app.on_event('startup')
+def build_openapi_docs() -> None:
+  """ Build the openapi docs at startup instead of during the first request for them """
+  create_openapi_docs()
 
 # additional yaml version of openapi.json
 # this is much more human readable
@@ -653,14 +756,14 @@ def read_openapi_yaml() -> Response:
   """ Read the openapi yaml file
 
   This much more human readable than the json version """
-  return Response(create_yaml_doc(), media_type='text/yaml')
+  return Response(create_openapi_docs()[1], media_type='text/yaml')
 
 @app.get('/openapi.json', include_in_schema=False)
 def read_openapi_json():
   """ Read the openapi json file
 
   This is slightly easier to process by our test framework """
-  return app.openapi()
+  return Response(create_openapi_docs()[0], media_type='application/json')
 
 app.openapi = generate_openapi_spec # type: ignore
 
@@ -676,7 +779,7 @@ def doc():
 
 @app.get('/', include_in_schema=False)
 @app.get('/{src}', include_in_schema=False)
-def view(request: Request, ctrl: Api = Depends(get_ctrl), src: int = 0):
+def view(request: Request, ctrl: Api = Depends(get_ctrl_async), src: int = 0):
   """ Webapp main view """
   state = ctrl.get_state()
   context = {
@@ -688,11 +791,8 @@ def view(request: Request, ctrl: Api = Depends(get_ctrl), src: int = 0):
     'zones': state.zones,
     'groups': state.groups,
     'presets': state.presets,
-    'inputs': [ctrl.get_inputs(src) for src in state.sources],
-    'unused_groups': [unused_groups(ctrl, src.id) for src in state.sources if src.id is not None],
-    'unused_zones': [unused_zones(ctrl, src.id) for src in state.sources if src.id is not None],
-    'ungrouped_zones': [ungrouped_zones(ctrl, src.id) for src in state.sources if src.id is not None],
-    'song_info': [src.info for src in state.sources if src.info is not None], # src.info should never be None
+    'inputs': [ctrl.get_inputs(src, state.streams) for src in state.sources],
+    **_view_state(state),
     'version': state.info.version if state.info else 'unknown',
   }
   return templates.TemplateResponse('index.html.j2', context, media_type='text/html')
@@ -709,6 +809,7 @@ def create_app(mock_ctrl=None, mock_streams=None, config_file=None, delay_saves=
   if delay_saves is not None:
     settings.delay_saves = delay_saves
   get_ctrl().reinit(settings, change_notifier=notify_on_change)
+  create_openapi_docs.cache_clear() # the docs' examples are based on the configuration
   return app
 
 def get_ip_addr(iface: str = 'eth0') -> Optional[str]:
@@ -808,4 +909,4 @@ if __name__ == "__main__":
   parser.add_argument('file', type=argparse.FileType('w'))
   args = parser.parse_args()
   with args.file as file:
-    file.write(create_yaml_doc(add_test_docs=False))
+    file.write(create_openapi_docs(add_test_docs=False)[1].decode('utf-8'))
@@ -19,6 +19,17 @@
 """AmpliPi Webapp Init
 
 This initializes the webapplication found in app.py.
+
+The application is served by uvicorn using the uvloop event loop and the httptools http parser,
+both are pulled in by installing uvicorn[standard]. For example:
+
+  python -m uvicorn --loop uvloop --http httptools --no-access-log amplipi.asgi:application
+
+It must be served by a single worker process (no gunicorn -w N or uvicorn --workers N).
+Each worker would create its own controller, which owns the preamp hardware, the stream processes,
+and the in-memory system state that is periodically saved to the config file.
+Multiple workers would fight over the hardware and diverge in state.
+Serialization of the large responses is cached instead (see Api.get_state_json).
 """
 
 import os
@@ -20,16 +20,19 @@ This module provides complete control of the AmpliPi Audio System's sources,
 zones, groups and streams.
 """
 
-from typing import List, Dict, Set, Union, Optional, Callable
+from typing import List, Dict, Set, Union, Optional, Callable, Tuple, Any, TypeVar, cast
 
 from enum import Enum
 
-from copy import deepcopy
+import functools
+import hashlib
 import os # files
 import time
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import wrapt
+from pydantic_core import to_json
 
 import amplipi.models as models
 import amplipi.rt as rt
@@ -47,6 +50,18 @@ def save_on_success(wrapped, instance: 'Api', args, kwargs):
     instance.mark_changes()
   return result
 
+F = TypeVar('F', bound=Callable[..., Any])
+
+def changes_state(func: F) -> F:
+  """ Invalidate the cached serialized state after a ctrl API call that can modify it (successful or not) """
+  @functools.wraps(func)
+  def wrapper(self: 'Api', *args, **kwargs):
+    try:
+      return func(self, *args, **kwargs)
+    finally:
+      self._state_version += 1
+  return cast(F, wrapper)
+
 class ApiCode(Enum):
   """ Ctrl Api Response code """
   OK = 1
@@ -85,6 +100,7 @@ class Api:
   _mock_hw: bool
   _mock_streams: bool
   _save_timer: Optional[threading.Timer] = None
+  _save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ctrl-save') # saves are written in order, off of the api caller's thread
   _delay_saves: bool
   _change_notifier: Optional[Callable[[models.Status], None]] = None
   _rt: Union[rt.Rpi, rt.Mock]
@@ -93,6 +109,14 @@ class Api:
   config_file_valid: bool
   status: models.Status
   streams: Dict[int, amplipi.streams.AnyStream]
+  _state_version: int = 0 # incremented every time the state may have been modified
+  _cached_json: Dict[Optional[str], Tuple[Any, bytes, str]] # serialized state (None) or state field: (cache key, json, etag)
+  _indexed_version: Optional[int] = None # state version the id indexes below were built from
+  _groups_by_id: Dict[int, models.Group] = {}
+  _streams_by_id: Dict[int, models.Stream] = {}
+  _presets_by_id: Dict[int, models.Preset] = {}
+  _source_idx: Dict[int, int] = {} # source id: index in status.sources, sources are fixed after startup
+  _zone_idx: Dict[int, int] = {} # zone id: index in status.zones, zones are fixed after startup
 
   _LAST_PRESET_ID = 9999
   DEFAULT_CONFIG = { # This is the system state response that will come back from the amplipi box
@@ -141,6 +165,7 @@ class Api:
     self.reinit(settings, change_notifier)
     self._initialized = True
 
+  @changes_state
   def reinit(self, settings: models.AppSettings = models.AppSettings(), change_notifier: Optional[Callable[[models.Status], None]] = None, config: Optional[models.Status] = None):
     """ Initialize or Reinitialize the controller
 
@@ -150,6 +175,7 @@ class Api:
     self._mock_streams = settings.mock_streams
     self._save_timer = None
     self._delay_saves = settings.delay_saves
+    self._cached_json = {}
     self._settings = settings
 
     # Create firmware interface. If one already exists delete then re-init.
@@ -163,6 +189,9 @@ class Api:
         pass
     self._rt = rt.Mock() if settings.mock_ctrl else rt.Rpi() # reset the fw
 
+    # make sure any queued saves are written before the config file is read
+    self._save_pool.submit(lambda: None).result()
+
     # test open the config file, this will throw an exception if there are issues writing to the file
     with open(settings.config_file, 'a'): # use append more to make sure we have read and write permissions, but won't overrite the file
       pass
@@ -180,7 +209,8 @@ class Api:
       for cfg_path in config_paths:
         try:
           if os.path.exists(cfg_path):
-            self.status = models.Status.parse_file(cfg_path)
+            with open(cfg_path, encoding='utf-8') as cfg:
+              self.status = models.Status.model_validate_json(cfg.read())
             loaded_config = True
             break
           errors.append('config file "{}" does not exist'.format(cfg_path))
@@ -191,7 +221,7 @@ class Api:
     if not loaded_config:
       print(errors[0])
       print('using default config')
-      self.status = models.Status.parse_obj(self.DEFAULT_CONFIG)
+      self.status = models.Status.model_validate(self.DEFAULT_CONFIG)
       self.save()
 
     self.status.info = models.Info(
@@ -219,6 +249,8 @@ class Api:
     # save new config if zones were added
     if added_zone:
       self.save()
+    self._source_idx = {src.id: i for i, src in enumerate(self.status.sources) if src.id is not None}
+    self._zone_idx = {zone.id: i for i, zone in enumerate(self.status.zones) if zone.id is not None}
 
     # configure all streams into a known state
     self.streams: Dict[int, amplipi.streams.AnyStream] = {}
@@ -265,7 +297,7 @@ class Api:
           os.remove(self.backup_config_file)
         os.rename(self.config_file, self.backup_config_file)
       with open(self.config_file, 'w') as cfg:
-        cfg.write(self.status.json(exclude_none=True, indent=2))
+        cfg.write(self.status.model_dump_json(exclude_none=True, indent=2))
       self.config_file_valid = True
     except Exception as exc:
       print('Error saving config: {}'.format(exc))
@@ -273,7 +305,8 @@ class Api:
   def mark_changes(self):
     """ Mark api changes to update listeners and save the system state in the future
 
-    This attempts to avoid excessive saving and the resulting delays by only saving a small delay after the last change
+    This attempts to avoid excessive saving and the resulting delays by only saving a small delay after the last change.
+    Saves are queued on a dedicated thread so the caller never waits on the disk.
     """
     if self._change_notifier:
       self._change_notifier(self.get_state())
@@ -282,10 +315,10 @@ class Api:
         self._save_timer.cancel()
         self._save_timer = None
       # start can only be called once on a thread
-      self._save_timer = threading.Timer(5.0, self.save)
+      self._save_timer = threading.Timer(5.0, self._save_pool.submit, args=[self.save])
       self._save_timer.start()
     else:
-      self.save()
+      self._save_pool.submit(self.save)
 
   @staticmethod
   def _is_digital(src_type: str) -> bool:
@@ -296,9 +329,12 @@ class Api:
     """
     return src_type != 'local'
 
-  def get_inputs(self, src: models.Source) -> Dict[Union[str, None], str]:
+  def get_inputs(self, src: models.Source, streams: Optional[List[models.Stream]] = None) -> Dict[Union[str, None], str]:
     """Gets a dictionary of the possible inputs for a source
 
+      Args:
+        src: An audio source
+        streams: The available streams, if already known (avoids getting the system state again)
       Returns:
         A dictionary of the input types and a corresponding user friendly name/string for each
       Example:
@@ -308,7 +344,9 @@ class Api:
         { None, '', 'local', 'Local', 'stream=9449' }
     """
     inputs = {None: '', 'local' : f'{src.name} - rca'}
-    for stream in self.get_state().streams:
+    if streams is None:
+      streams = self.get_state().streams
+    for stream in streams:
       inputs['stream={}'.format(stream.id)] = f'{stream.name} - {stream.type}'
     return inputs
 
@@ -322,7 +360,7 @@ class Api:
       # TODO: this functionality should be in the unimplemented streams base class
       # convert the stream instance info to stream data (serialize its current configuration)
       st_type = type(stream_inst).__name__.lower()
-      stream = models.Stream(id=sid, name=stream_inst.name, type=st_type)
+      stream = models.Stream.model_construct(id=sid, name=stream_inst.name, type=st_type) # skip validation, this is our own trusted state
       for field in optional_fields:
         if field in stream_inst.__dict__:
           stream.__dict__[field] = stream_inst.__dict__[field]
@@ -334,6 +372,84 @@ class Api:
       self._update_src_info(src)
     return self.status
 
+  def _update_indexes(self) -> None:
+    """ Rebuild the id lookups of groups, streams, and presets if the state may have changed since they were built """
+    version = self._state_version # read first, a change made while indexing must trigger another rebuild
+    if self._indexed_version != version:
+      state = self.get_state()
+      self._groups_by_id = {group.id: group for group in state.groups if group.id is not None}
+      self._streams_by_id = {stream.id: stream for stream in state.streams if stream.id is not None}
+      self._presets_by_id = {preset.id: preset for preset in state.presets if preset.id is not None}
+      self._indexed_version = version
+
+  def _find_source(self, sid: int) -> Union[Tuple[int, models.Source], Tuple[None, None]]:
+    """ Find a source and its index by id """
+    idx = self._source_idx.get(sid)
+    if idx is None:
+      return None, None
+    return idx, self.status.sources[idx]
+
+  def _find_zone(self, zid: int) -> Union[Tuple[int, models.Zone], Tuple[None, None]]:
+    """ Find a zone and its index by id """
+    idx = self._zone_idx.get(zid)
+    if idx is None:
+      return None, None
+    return idx, self.status.zones[idx]
+
+  def get_group_by_id(self, gid: int) -> Optional[models.Group]:
+    """ get a group by its id, None if it doesn't exist """
+    self._update_indexes()
+    return self._groups_by_id.get(gid)
+
+  def get_stream_by_id(self, sid: int) -> Optional[models.Stream]:
+    """ get a stream by its id, None if it doesn't exist """
+    self._update_indexes()
+    return self._streams_by_id.get(sid)
+
+  def get_preset_by_id(self, pid: int) -> Optional[models.Preset]:
+    """ get a preset by its id, None if it doesn't exist """
+    self._update_indexes()
+    return self._presets_by_id.get(pid)
+
+  def _get_json(self, field: Optional[str] = None) -> Tuple[bytes, str]:
+    """ get the system state, or one of its fields wrapped in an object, serialized as json along with its ETag
+
+    The serialized json and its ETag are reused until the state is modified or one of the sources' info changes.
+    """
+    state = self.get_state()
+    # source info is updated by the streams themselves, so it needs to be part of the key
+    key = (self._state_version, [src.info for src in state.sources])
+    cached = self._cached_json.get(field)
+    if cached is None or cached[0] != key:
+      content = state if field is None else {field: getattr(state, field)}
+      content_json = to_json(content, exclude_none=True)
+      cached = self._cached_json[field] = (key, content_json, f'"{hashlib.md5(content_json).hexdigest()}"')
+    return cached[1], cached[2]
+
+  def get_state_json(self) -> Tuple[bytes, str]:
+    """ get the system state serialized as json, and an ETag that only changes when the json does """
+    return self._get_json()
+
+  def get_sources_json(self) -> bytes:
+    """ get the sources serialized as json, ie. {"sources": [...]} """
+    return self._get_json('sources')[0]
+
+  def get_zones_json(self) -> bytes:
+    """ get the zones serialized as json, ie. {"zones": [...]} """
+    return self._get_json('zones')[0]
+
+  def get_groups_json(self) -> bytes:
+    """ get the groups serialized as json, ie. {"groups": [...]} """
+    return self._get_json('groups')[0]
+
+  def get_streams_json(self) -> bytes:
+    """ get the streams serialized as json, ie. {"streams": [...]} """
+    return self._get_json('streams')[0]
+
+  def get_presets_json(self) -> bytes:
+    """ get the presets serialized as json, ie. {"presets": [...]} """
+    return self._get_json('presets')[0]
+
   def get_items(self, tag: str) -> Optional[List[models.Base]]:
     """ Gets one of the lists of elements contained in status named by @t (or t's plural
 
@@ -374,10 +490,11 @@ class Api:
       src.info = stream_inst.info()
     elif src.input == 'local' and src.id is not None:
       # RCA, name mimics the steam's formatting
-      src.info = models.SourceInfo(img_url='static/imgs/rca_inputs.svg', name=f'{src.name} - rca', state='unknown')
+      src.info = models.SourceInfo.model_construct(img_url='static/imgs/rca_inputs.svg', name=f'{src.name} - rca', state='unknown')
     else:
-      src.info = models.SourceInfo(img_url='static/imgs/disconnected.png', name='None', state='stopped')
+      src.info = models.SourceInfo.model_construct(img_url='static/imgs/disconnected.png', name='None', state='stopped')
 
+  @changes_state
   def set_source(self, sid: int, update: models.SourceUpdate, force_update: bool = False, internal: bool = False) -> ApiResponse:
     """Modifes the configuration of one of the 4 system sources
 
@@ -390,7 +507,7 @@ class Api:
       Returns:
         'None' on success, otherwise error (dict)
     """
-    idx, src = utils.find(self.status.sources, sid)
+    idx, src = self._find_source(sid)
     if idx is not None and src is not None:
       name, _ = utils.updated_val(update.name, src.name)
       input_, input_updated = utils.updated_val(update.input, src.input)
@@ -431,6 +548,7 @@ class Api:
     else:
       return ApiResponse.error('failed to set source: index {} out of bounds'.format(idx))
 
+  @changes_state
   def set_zone(self, zid, update: models.ZoneUpdate, force_update: bool = False, internal: bool = False) -> ApiResponse:
     """Reconfigures a zone
 
@@ -442,7 +560,7 @@ class Api:
       Returns:
         ApiResponse
     """
-    idx, zone = utils.find(self.status.zones, zid)
+    idx, zone = self._find_zone(zid)
     if idx is not None and zone is not None:
       name, _ = utils.updated_val(update.name, zone.name)
       source_id, update_source_id = utils.updated_val(update.source_id, zone.source_id)
@@ -508,6 +626,7 @@ class Api:
     else:
         return ApiResponse.error('set zone: index {} out of bounds'.format(idx))
 
+  @changes_state
   def set_zones(self, multi_update: models.MultiZoneUpdate, force_update: bool = False, internal: bool = False) -> ApiResponse:
     """Reconfigures a set of zones
 
@@ -521,7 +640,7 @@ class Api:
     # update each of the zones
     resp = ApiResponse.ok()
     for zid in all_zids:
-      zupdate = multi_update.update.copy() # we potentially need to make changes to the underlying update
+      zupdate = multi_update.update.model_copy() # we potentially need to make changes to the underlying update
       if zupdate.name:
         # ensure all zones don't get named the same
         zupdate.name = f'{zupdate.name} {zid+1}'
@@ -549,6 +668,7 @@ class Api:
         group.source_id = None
       group.vol_delta = (vols[0] + vols[-1]) // 2 # group volume is the midpoint between the highest and lowest source
 
+  @changes_state
   def set_group(self, gid, update: models.GroupUpdate, internal: bool = False) -> ApiResponse:
     """Configures an existing group
         parameters will be used to configure each sone in the group's zones
@@ -597,6 +717,7 @@ class Api:
     """ get next available group id """
     return utils.next_available_id(self.status.groups, default=100)
 
+  @changes_state
   def create_group(self, group: models.Group) -> models.Group:
     """Creates a new group with a list of zones
 
@@ -620,6 +741,7 @@ class Api:
     self.mark_changes()
     return group
 
+  @changes_state
   @save_on_success
   def delete_group(self, gid: int) -> ApiResponse:
     """Deletes an existing group"""
@@ -638,6 +760,7 @@ class Api:
       return stream.id + 1
     return 1000
 
+  @changes_state
   def create_stream(self, data: models.Stream, internal=False) -> models.Stream:
     """ Create a new stream """
     try:
@@ -655,6 +778,7 @@ class Api:
     except Exception as exc:
       return ApiResponse.error('create stream failed: {}'.format(exc))
 
+  @changes_state
   @save_on_success
   def set_stream(self, sid: int, update: models.StreamUpdate) -> ApiResponse:
     """ Configure a stream """
@@ -665,12 +789,13 @@ class Api:
     except Exception as exc:
       return ApiResponse.error('Unable to get stream {}: {}'.format(sid, exc))
     try:
-      changes = update.dict(exclude_none=True)
+      changes = update.model_dump(exclude_none=True)
       stream.reconfig(**changes)
       return ApiResponse.ok()
     except Exception as exc:
       return ApiResponse.error('Unable to reconfigure stream {}: {}'.format(sid, exc))
 
+  @changes_state
   def delete_stream(self, sid: int, internal=False) -> ApiResponse:
     """Deletes an existing stream"""
     try:
@@ -689,6 +814,7 @@ class Api:
     except KeyError:
       return ApiResponse.error('delete stream failed: {} does not exist'.format(sid))
 
+  @changes_state
   @save_on_success
   def exec_stream_command(self, sid: int, cmd: str) -> ApiResponse:
     """Sets play/pause on a specific pandora source """
@@ -741,6 +867,7 @@ class Api:
     """ get next available preset id """
     return utils.next_available_id(self.status.presets, default=10000)
 
+  @changes_state
   def create_preset(self, preset: models.Preset, internal=False) -> Union[ApiResponse, models.Preset]:
     """ Create a new preset """
     try:
@@ -756,11 +883,12 @@ class Api:
     except Exception as exc:
       return ApiResponse.error('create preset failed: {}'.format(exc))
 
+  @changes_state
   @save_on_success
   def set_preset(self, pid: int, update: models.PresetUpdate) -> ApiResponse:
     """ Reconfigure a preset """
     i, preset = utils.find(self.status.presets, pid)
-    changes = update.dict(exclude_none=True)
+    changes = update.model_dump(exclude_none=True)
     if i is None:
       return ApiResponse.error('Unable to find preset to redefine')
 
@@ -772,6 +900,7 @@ class Api:
     except Exception as exc:
       return ApiResponse.error('Unable to reconfigure preset {}: {}'.format(pid, exc))
 
+  @changes_state
   @save_on_success
   def delete_preset(self, pid: int) -> ApiResponse:
     """ Deletes an existing preset """
@@ -859,6 +988,7 @@ class Api:
     # update stats
     self._update_groups()
 
+  @changes_state
   def load_preset(self, pid: int, internal=False) -> ApiResponse:
     """ To avoid any issues with audio coming out of the wrong speakers, we will need to carefully load a preset configuration.
     Below is an idea of how a preset configuration could be loaded to avoid any weirdness.
@@ -887,10 +1017,10 @@ class Api:
       id=9999,
       name='Restore last config',
       last_used=None, # this need to be in javascript time format
-      state=models.PresetState(
-        sources=deepcopy(status.sources),
-        zones=deepcopy(status.zones),
-        groups=deepcopy(status.groups)
+      state=models.PresetState( # dumped so they can be validated as their update types
+        sources=[src.model_dump() for src in status.sources],
+        zones=[zone.model_dump() for zone in status.zones],
+        groups=[group.model_dump() for group in status.groups]
       )
     )
     if last_pid is None:
@@ -911,6 +1041,7 @@ class Api:
     # TODO: release lock
     return ApiResponse.ok()
 
+  @changes_state
   def announce(self, announcement: models.Announcement) -> ApiResponse:
     """ Create and play an announcement """
     # create a temporary announcement stream using fileplayer
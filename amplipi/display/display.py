@@ -4,6 +4,11 @@
 # pip: adafruit-circuitpython-rgb-display pillow numpy
 #      loguru requests rpi.gpio netifaces psutil
 # apt: libatlas-base-dev
+#
+# pillow-simd is a drop-in replacement for pillow that speeds up the text and
+# rectangle drawing, but its SIMD paths are x86 only (SSE4/AVX2). On the Pi's
+# ARM cores it builds from source and falls back to the same scalar code, so
+# pillow is kept as the requirement here.
 
 import sys
 if 'venv' not in sys.prefix:
@@ -13,11 +18,16 @@ if 'venv' not in sys.prefix:
 import argparse
 import busio
 import cProfile
+from concurrent.futures import Future, ThreadPoolExecutor
 import digitalio
+import functools
 from loguru import logger as log
+import numpy as np
 import requests
 import signal
 import socket
+import struct
+import threading
 import time
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -139,15 +149,36 @@ _active_screen = 0
 # 6.66 MHz but much faster speeds seem to work okay.
 spi_baud = 16 * 10**6
 
-# Determine the full URL to contact, and if no specific port was specified
-# then use port 5000 as a fallback in case the debug webserver is running.
-API_URL = 'http://' + args.url + '/api'
-API_URL_DEBUG = None
-if ':' not in args.url:
-  API_URL_DEBUG = 'http://' + args.url + ':5000/api'
+url_host, _, url_port = args.url.partition(':')
+
+def resolve_api_urls() -> Tuple[str, Optional[str]]:
+  """ Resolve the AmpliPi's hostname and determine the full URL(s) to contact
+
+  The hostname is resolved up front, otherwise every request looks it up again,
+  which can stall for seconds when the name can't be resolved. If no specific port
+  was specified then port 5000 is used as a fallback in case the debug webserver is running.
+  """
+  try:
+    api_addr = socket.gethostbyname(url_host)
+  except OSError:
+    log.warning(f"Couldn't resolve {url_host}, it will be looked up on every request")
+    api_addr = url_host
+  api_url = 'http://' + api_addr + (':' + url_port if url_port else '') + '/api'
+  api_url_debug = None if url_port else 'http://' + api_addr + ':5000/api'
+  return api_url, api_url_debug
+
+API_URL, API_URL_DEBUG = resolve_api_urls()
+# The URLs as the user specified them, for messages, since the resolved address can change
+API_NAME = 'http://' + args.url + '/api'
+API_NAME_DEBUG = None if url_port else 'http://' + url_host + ':5000/api'
 
 # Convert number range to color gradient (min=green, max=red)
+# The stats are displayed with one decimal place, so cache the colors at that resolution
 def gradient(num, min_val=0, max_val=100):
+  return _gradient(round(num, 1), min_val, max_val)
+
+@functools.lru_cache(maxsize=1024)
+def _gradient(num, min_val, max_val):
   #red = round(255*(val - min_val) / (max_val - min_val))
   #grn = round(255-red)#255*(max_val - val) / (max_val - min_val)
   mid = (min_val + max_val) / 2
@@ -166,9 +197,17 @@ def gradient(num, min_val=0, max_val=100):
     grn = 255 - round(scale * (num - mid))
   return f'#{red:02X}{grn:02X}00'
 
+# Reuse the connection to the AmpliPi between polls
+_session = requests.Session()
+
+# Last status received from each url, as (etag, sources, zones)
+_status_cache: Dict[str, Tuple[str, List[models.Source], List[models.Zone]]] = {}
+
 def get_amplipi_data(base_url: Optional[str]) -> Tuple[bool, List[models.Source], List[models.Zone]]:
   """ Get the AmpliPi's status via the REST API
       Returns true/false on success/failure, as well as the sources and zones
+
+      The status is only downloaded and parsed again when its ETag changes
   """
   _zones: List[models.Zone] = []
   _sources: List[models.Source] = []
@@ -176,14 +215,20 @@ def get_amplipi_data(base_url: Optional[str]) -> Tuple[bool, List[models.Source]
   if base_url is None:
     return False, _sources, _zones
   try:
-    """ TODO: If the AmpliPi server isn't available at this url, there is a
-    5-second delay introduced by socket.getaddrinfo """
-    req = requests.get(base_url, timeout=0.2)
-    if req.status_code == 200:
-      status = models.Status(**req.json())
+    cached = _status_cache.get(base_url)
+    headers = {'If-None-Match': cached[0]} if cached else {}
+    req = _session.get(base_url, headers=headers, timeout=(0.1, 0.5)) # (connect, read)
+    if req.status_code == 304 and cached:
+      _, _sources, _zones = cached
+      success = True
+    elif req.status_code == 200:
+      status = models.Status.model_validate_json(req.content)
       _zones = status.zones
       _sources = status.sources
       success = True
+      etag = req.headers.get('ETag')
+      if etag:
+        _status_cache[base_url] = (etag, _sources, _zones)
     else:
       log.error('Bad status code returned from AmpliPi')
   except requests.ConnectionError as err:
@@ -195,15 +240,43 @@ def get_amplipi_data(base_url: Optional[str]) -> Tuple[bool, List[models.Source]
 
   return success, _sources, _zones
 
-# Draw volumes on bars.
-# Draw is a PIL drawing surface
-# zones is a list of (names, volumes) of size [6, 12, 18, 24, 30, 36]
-# (x,y) is the top-left of the volume bar area
-def draw_volume_bars(draw, font, small_font, zones: List[models.Zone], x=0, y=0, width=320, height=240):
-  n = len(zones)
-  if n == 0: # No zone info from AmpliPi server
-    pass
-  elif n <= 6: # Draw horizonal bars
+@functools.lru_cache(maxsize=None)
+def label_mask(text: str, font: ImageFont.FreeTypeFont, anchor: str = 'la') -> Tuple[Image.Image, Tuple[int, int]]:
+  """ Rasterize a static label once into a grayscale mask
+      Returns the mask and its offset from the text anchor
+  """
+  left, top, right, bottom = (int(v) for v in font.getbbox(text, anchor=anchor))
+  mask = Image.new('L', (right - left, bottom - top))
+  ImageDraw.Draw(mask).text((-left, -top), text, anchor=anchor, font=font, fill=255)
+  return mask, (left, top)
+
+def label_strip(labels: List[Tuple[Tuple[int, int], str]], font: ImageFont.FreeTypeFont) -> Image.Image:
+  """ Composite several static labels, given as ((x, y), text), into a single mask
+      that can be drawn at the top-left of the image in one call
+  """
+  width = max(x + int(font.getbbox(text)[2]) for (x, _), text in labels)
+  height = max(y + int(font.getbbox(text)[3]) for (_, y), text in labels)
+  mask = Image.new('L', (width, height))
+  draw_mask = ImageDraw.Draw(mask)
+  for xy, text in labels:
+    draw_mask.text(xy, text, font=font, fill=255)
+  return mask
+
+def draw_label(draw: ImageDraw.ImageDraw, xy: Tuple[int, int], text: str, font: ImageFont.FreeTypeFont,
+               anchor: str = 'la', fill: str = '#FFFFFF'):
+  """ Draw static text from its cached mask instead of re-rasterizing the glyphs every frame """
+  mask, (dx, dy) = label_mask(text, font, anchor)
+  draw.bitmap((xy[0] + dx, xy[1] + dy), mask, fill=fill)
+
+@functools.lru_cache(maxsize=32)
+def volume_bar_layout(n: int, small_font: ImageFont.FreeTypeFont, x: int, y: int, width: int, height: int):
+  """ Compute where each of the n volume bars and their labels go, this only changes with the zone count
+      Returns whether the bars are vertical, each bar's label position and background rectangle,
+      and the dB to pixels conversion factor
+  """
+  labels = []
+  bars = []
+  if n <= 6: # Horizontal bars
     wb = int(width / 2)                   # Each bar's full width
     hb = 12                               # Each bar's height
     sp = int((height - n*hb) / (2*(n-1))) # Spacing between bars
@@ -211,42 +284,69 @@ def draw_volume_bars(draw, font, small_font, zones: List[models.Zone], x=0, y=0,
     vol2pix = wb / -78
     for i in range(n):
       yb = y + i*hb + 2*i*sp # Bar starting y-position
+      labels.append((x, yb))
+      bars.append((xb, int(yb+2), xb+wb, int(yb+hb)))
+    return False, tuple(labels), tuple(bars), vol2pix
+  # Vertical bars
+  # Get the pixel height of a character, and add vertical margins
+  ch = small_font.getbbox('0', anchor='lt')[3] + 4
+  wb = 12                               # Each bar's width
+  sp = int((width - n*wb) / (2*(n-1)))  # Spacing between bars
+  yt = y + height - ch                  # Text top y-position
+  vol2pix = (height - ch) / -78         # dB to pixels conversion factor
+  for i in range(n):
+    xb = x + i*wb + 2*i*sp # Bar starting x-position
+    labels.append((xb + round(wb/2), y + height - round(ch/2)))
+    bars.append((xb, y, xb+wb, int(yt)))
+  return True, tuple(labels), tuple(bars), vol2pix
+
+@functools.lru_cache(maxsize=None)
+def glyph_advance(char: str, font: ImageFont.FreeTypeFont) -> float:
+  """ Get how far the pen moves after drawing a character """
+  return font.getlength(char)
+
+def draw_glyphs(draw: ImageDraw.ImageDraw, xy: Tuple[int, int], text: str, font: ImageFont.FreeTypeFont, fill: str):
+  """ Draw frequently changing text, like the stats' numbers, a character at a time from cached glyph masks
+
+  This matches draw.text() for fonts without kerning, like the monospace font used here
+  """
+  x, y = xy
+  pen = 0.0
+  for char in text:
+    mask, (dx, dy) = label_mask(char, font)
+    draw.bitmap((x + int(pen) + dx, y + dy), mask, fill=fill)
+    pen += glyph_advance(char, font)
 
-      # Draw zone name as text
-      draw.text((x, yb), zones[i].name, font=font, fill='#FFFFFF')
-
-      # Draw background of volume bar
-      draw.rectangle(((xb, int(yb+2), xb+wb, int(yb+hb))), fill='#999999')
-
-      # Draw volume bar
-      if zones[i].vol > -79:
-        color = '#666666' if zones[i].mute else '#0080ff'
-        xv = xb + (wb - round(zones[i].vol * vol2pix))
-        draw.rectangle(((xb, int(yb+2), xv, int(yb+hb))), fill=color)
-  elif n <= 18: # Draw vertical bars
-    # Get the pixel height of a character, and add vertical margins
-    ch = small_font.getbbox('0', anchor='lt')[3] + 4
-    wb = 12                               # Each bar's width
-    sp = int((width - n*wb) / (2*(n-1)))  # Spacing between bars
-    yt = y + height - ch                  # Text top y-position
-    vol2pix = (height - ch) / -78         # dB to pixels conversion factor
-    for i in range(n):
-      xb = x + i*wb + 2*i*sp # Bar starting x-position
-
+# Draw volumes on bars.
+# Draw is a PIL drawing surface
+# zones is a list of (names, volumes) of size [6, 12, 18, 24, 30, 36]
+# (x,y) is the top-left of the volume bar area
+def draw_volume_bars(draw, font, small_font, zones: List[models.Zone], x=0, y=0, width=320, height=240):
+  n = len(zones)
+  if n == 0: # No zone info from AmpliPi server
+    return
+  if n > 18:
+    log.error("Can't display more than 18 volumes")
+    return
+  vertical, labels, bars, vol2pix = volume_bar_layout(n, small_font, x, y, width, height)
+  for i, (zone, label_xy, (x0, y0, x1, y1)) in enumerate(zip(zones, labels, bars)):
+    if vertical:
       # Draw zone number as centered text
-      draw.text((xb + round(wb/2), y + height - round(ch/2)), str(i+1),
-                anchor='mm', font=small_font, fill='#FFFFFF')
+      draw_label(draw, label_xy, str(i+1), small_font, anchor='mm')
+    else:
+      # Draw zone name as text
+      draw.text(label_xy, zone.name, font=font, fill='#FFFFFF')
 
-      # Draw background of volume bar
-      draw.rectangle(((xb, y, xb+wb, yt)), fill='#999999')
+    # Draw background of volume bar
+    draw.rectangle((x0, y0, x1, y1), fill='#999999')
 
-      # Draw volume bar
-      if zones[i].vol > -79:
-        color = '#666666' if zones[i].mute else '#0080ff'
-        yv = y + round(zones[i].vol * vol2pix)
-        draw.rectangle(((xb, yv, xb+wb, yt)), fill=color)
-  else:
-    log.error("Can't display more than 18 volumes")
+    # Draw volume bar
+    if zone.vol > -79:
+      color = '#666666' if zone.mute else '#0080ff'
+      if vertical:
+        draw.rectangle((x0, y0 + round(zone.vol * vol2pix), x1, y1), fill=color)
+      else:
+        draw.rectangle((x0, y0, x1 - round(zone.vol * vol2pix), y1), fill=color)
 
 
 # Pins
@@ -258,10 +358,90 @@ touch_cs.value = True
 
 # Setup SPI bus using hardware SPI:
 spi = busio.SPI(clock=clk_pin, MOSI=mosi_pin, MISO=miso_pin)
+# The display and touch screen share the bus, this lets a touch read block
+# until a frame transfer is done instead of spinning on spi.try_lock()
+spi_lock = threading.Lock()
 
 # Create the ILI9341 display:
 display = ili9341.ILI9341(spi, cs=disp_cs, dc=disp_dc, rst=rst_pin, baudrate=spi_baud, rotation=270)
 
+def image_to_565(img: Image.Image, rotation: int = 0) -> np.ndarray:
+  """ Convert an RGB image to the display's RGB565 pixel format (big-endian),
+      rotating it counterclockwise by a multiple of 90 degrees
+  """
+  # Mask the channels while they are still bytes, and rotate the packed pixels rather than the RGB triplets
+  rgb = np.asarray(img)
+  color = (rgb[:, :, 0] & 0xF8).astype(np.uint16) << 8
+  color |= (rgb[:, :, 1] & 0xFC).astype(np.uint16) << 3
+  color |= rgb[:, :, 2] >> 3
+  if rotation:
+    color = np.rot90(color, rotation // 90)
+  return color.astype('>u2')
+
+def changed_regions(old: np.ndarray, new: np.ndarray, max_gap: int = 8) -> List[Tuple[int, int, int, int]]:
+  """ Find the (x0, y0, x1, y1) windows, inclusive, covering every pixel that differs between two frames
+
+  Changed rows are grouped into bands, merging bands less than max_gap rows
+  apart so a few unchanged rows don't cost an extra window setup
+  """
+  changed = old != new
+  rows = np.flatnonzero(changed.any(axis=1))
+  if rows.size == 0:
+    return []
+  splits = np.flatnonzero(np.diff(rows) > max_gap) + 1
+  regions = []
+  for band in np.split(rows, splits):
+    y0, y1 = int(band[0]), int(band[-1])
+    cols = np.flatnonzero(changed[y0:y1+1].any(axis=0))
+    regions.append((int(cols[0]), y0, int(cols[-1]), y1))
+  return regions
+
+# pylint: disable=protected-access
+# Window setup commands, only the coordinates change between blocks so they are packed into a reused buffer
+_column_set = bytes([display._COLUMN_SET])
+_page_set = bytes([display._PAGE_SET])
+_ram_write = bytes([display._RAM_WRITE])
+_window_pos = bytearray(4)
+
+def write_block(x0: int, y0: int, x1: int, y1: int, data: bytes):
+  """ Write a block of pixels to the display, equivalent to display._block()
+
+  This sends the window setup and the pixels in a single SPI transaction
+  instead of locking and configuring the bus for each of its 6 writes
+  """
+  with display.spi_device as bus:
+    for cmd, start, end in ((_column_set, x0 + display._X_START, x1 + display._X_START),
+                            (_page_set, y0 + display._Y_START, y1 + display._Y_START)):
+      struct.pack_into(display._ENCODE_POS, _window_pos, 0, start, end)
+      display.dc_pin.value = 0
+      bus.write(cmd)
+      display.dc_pin.value = 1
+      bus.write(_window_pos)
+    display.dc_pin.value = 0
+    bus.write(_ram_write)
+    display.dc_pin.value = 1
+    bus.write(data)
+# pylint: enable=protected-access
+
+_last_frame: Optional[np.ndarray] = None
+
+def display_image(img: Image.Image):
+  """ Send an RGB image to the display, only writing the regions that changed since the last image
+
+  This replaces display.image(), which rotates the image with PIL, builds a
+  list of Python ints for every pixel byte and rewrites the whole screen on each frame
+  """
+  global _last_frame
+  frame = image_to_565(img, display.rotation)
+  if _last_frame is None or _last_frame.shape != frame.shape:
+    regions = [(0, 0, frame.shape[1] - 1, frame.shape[0] - 1)]
+  else:
+    regions = changed_regions(_last_frame, frame)
+  with spi_lock:
+    for x0, y0, x1, y1 in regions:
+      write_block(x0, y0, x1, y1, frame[y0:y1+1, x0:x1+1].tobytes())
+  _last_frame = frame
+
 # Set backlight brightness out of 65535
 # Turn off until first image is written to work around not having RST
 led = pwmio.PWMOut(led_pin, frequency=5000, duty_cycle=0)
@@ -281,27 +461,33 @@ _cal = (300, 400, 3600, 3850) # Top-left and bottom-right coordinates as raw ADC
 _max_dist = 0.05 * ((_cal[3] - _cal[1]) ** 2 + (_cal[2] - _cal[0]) ** 2) ** 0.5
 
 def read_xpt2046(tx_buf: bytearray, rx_buf: bytearray):
-  # Try to access SPI, wait if someone else (i.e. screen) is busy
-  while not spi.try_lock():
-    pass
-  spi.configure(baudrate=int(2.5*10**6))
-  touch_cs.value = False
-  spi.write_readinto(tx_buf, rx_buf)
-  touch_cs.value = True
-  spi.configure(baudrate=spi_baud)
-  spi.unlock()
+  # Wait for any frame transfer to finish before taking the bus
+  with spi_lock:
+    while not spi.try_lock():
+      time.sleep(0)
+    spi.configure(baudrate=int(2.5*10**6))
+    touch_cs.value = False
+    spi.write_readinto(tx_buf, rx_buf)
+    touch_cs.value = True
+    spi.configure(baudrate=spi_baud)
+    spi.unlock()
   return rx_buf
 
-def read_xy():
-  tx_buf = bytearray(5)
-  rx_buf = bytearray(5)
-  tx_buf[0] = XPT2046_CMD_X
-  tx_buf[2] = XPT2046_CMD_Y
-  rx_buf = read_xpt2046(tx_buf, rx_buf)
+_TOUCH_SAMPLES = 16
+# Read X then Y for each sample, each command is sent while the previous result is still being clocked out
+_touch_tx = bytearray(5 * _TOUCH_SAMPLES)
+_touch_tx[0::5] = bytes([XPT2046_CMD_X]) * _TOUCH_SAMPLES
+_touch_tx[2::5] = bytes([XPT2046_CMD_Y]) * _TOUCH_SAMPLES
+_touch_rx = bytearray(5 * _TOUCH_SAMPLES)
 
-  x = (rx_buf[1] << 5) | (rx_buf[2] >> 3)
-  y = (rx_buf[3] << 5) | (rx_buf[4] >> 3)
-  return (x,y)
+def read_xy_burst() -> Tuple[np.ndarray, np.ndarray]:
+  """ Read all of the touch position samples in a single SPI transfer
+      Returns arrays of the raw x and y ADC values
+  """
+  rx = np.frombuffer(read_xpt2046(_touch_tx, _touch_rx), dtype=np.uint8).astype(np.int32)
+  x = (rx[1::5] << 5) | (rx[2::5] >> 3)
+  y = (rx[3::5] << 5) | (rx[4::5] >> 3)
+  return x, y
 
 def read_temp_raw():
   tx_buf = bytearray(5)
@@ -346,32 +532,22 @@ def touch_callback(pin_num):
   # Mask the interrupt since reading the position generates a false interrupt
   gpio.remove_event_detect(t_irq_pin.id)
 
-  # Average 16 values
-  x_raw_list = []
-  y_raw_list = []
-  for i in range(16):
-    x, y = read_xy()
-    #x_sum += x
-    #y_sum += y
-    if (x >= _cal[0] and y <= _cal[3]): # Valid touch
-      x_raw_list.append(x)
-      y_raw_list.append(y)
-    #print(f'Read point at x: {x}, y: {y}')
+  # Average several samples
+  x_raw_all, y_raw_all = read_xy_burst()
+  valid = (x_raw_all >= _cal[0]) & (y_raw_all <= _cal[3]) # Valid touches
+  x_raw_list = x_raw_all[valid]
+  y_raw_list = y_raw_all[valid]
   valid_count = len(x_raw_list)
   if valid_count > 0:
-    x_raw_mean = round(sum(x_raw_list) / valid_count)
-    y_raw_mean = round(sum(y_raw_list) / valid_count)
-    x_raw_keep = []
-    y_raw_keep = []
-    for i in range(valid_count):
-      dist = ((x_raw_list[i] - x_raw_mean) ** 2 + (y_raw_list[i] - y_raw_mean) ** 2) ** 0.5
-      if dist < _max_dist:
-        x_raw_keep.append(x_raw_list[i])
-        y_raw_keep.append(y_raw_list[i])
+    x_raw_mean = np.round(x_raw_list.mean())
+    y_raw_mean = np.round(y_raw_list.mean())
+    inliers = np.hypot(x_raw_list - x_raw_mean, y_raw_list - y_raw_mean) < _max_dist
+    x_raw_keep = np.sort(x_raw_list[inliers])
+    y_raw_keep = np.sort(y_raw_list[inliers])
     inlier_count = len(x_raw_keep)
-    if inlier_count >= 4: # At least a quarter of the points were valid and inliers
-      x_raw = sorted(x_raw_keep)[inlier_count//2]
-      y_raw = sorted(y_raw_keep)[inlier_count//2]
+    if inlier_count >= _TOUCH_SAMPLES // 4: # At least a quarter of the points were valid and inliers
+      x_raw = int(x_raw_keep[inlier_count//2])
+      y_raw = int(y_raw_keep[inlier_count//2])
 
       # Use calibration to scale to the range [0,1]
       x_cal = min(max((float(x_raw) - _cal[0]) / (_cal[2] - _cal[0]), 0), 1)
@@ -390,7 +566,7 @@ def touch_callback(pin_num):
       _sleep_timer = time.time()
       # TODO: Redraw screen instantly, don't wait for next display period
     else:
-      log.debug(f'Not enough inliers: {inlier_count} of 16')
+      log.debug(f'Not enough inliers: {inlier_count} of {_TOUCH_SAMPLES}')
   else:
     log.debug('No valid points')
 
@@ -413,7 +589,7 @@ signal.signal(signal.SIGTERM, exit_handler)
 # Load image and convert to RGB
 mn_logo = Image.open('amplipi/display/imgs/micronova_320x240.png').convert('RGB')
 ap_logo = Image.open('amplipi/display/imgs/amplipi_320x126.png').convert('RGB')
-display.image(mn_logo)
+display_image(mn_logo)
 
 # Turn on display backlight now that an image is loaded
 # TODO: Anything duty cycle less than 100% causes flickering
@@ -428,12 +604,31 @@ except:
   log.critical(f'Failed to load font {fontname}')
   sys.exit(3)
 
+# Character size
+cw = 8    # Character width
+ch = 16   # Character height
+
+# Static labels, drawn once and blitted every frame
+stat_labels = label_strip([((1*cw, 0*ch + 2), 'CPU:'),
+                           ((1*cw, 1*ch + 2), 'Mem:'),
+                           ((1*cw, 2*ch + 2), 'Disk:'),
+                           ((1*cw, 3*ch + 2), 'IP:')], font)
+source_labels = label_strip([((1*cw, int((4.5 + i)*ch)), f'Source {i + 1}:') for i in range(4)], font)
+
 # Create a blank image for drawing.
 # Swap height/width to rotate it to landscape
 height = display.width
 width = display.height
-image = Image.new('RGB', (width, height)) # Fill entire screen with drawing space
-draw = ImageDraw.Draw(image)
+# Frames alternate between two images so one can be drawn while the other is being sent
+images = [Image.new('RGB', (width, height)) for _ in range(2)] # Fill entire screen with drawing space
+draws = [ImageDraw.Draw(img) for img in images]
+back_buffer = 0
+
+# The volume bars are drawn into their own image, and only redrawn when a zone changes
+volume_bars_y = 9*ch - 2
+volume_bars = Image.new('RGB', (width, height - volume_bars_y))
+volume_bars_draw = ImageDraw.Draw(volume_bars)
+volume_bars_key: Optional[Tuple] = None
 
 # Keep the splash screen displayed a bit
 time.sleep(1.0)
@@ -450,10 +645,33 @@ connection_retries = 0
 sources: List[models.Source] = []
 zones: List[models.Zone] = []
 
+# Fetches the status off the main thread so the request overlaps with gathering stats
+_status_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='display-status')
+
+# Sends frames off the main thread so the next frame can be drawn during the SPI transfer
+_display_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='display-push')
+_display_push: Optional[Future] = None
+
+def push_image(img: Image.Image):
+  """ Send an image to the display in the background, after the previous image has been sent """
+  global _display_push
+  if _display_push is not None:
+    _display_push.result()
+  _display_push = _display_pool.submit(display_image, img)
+
+# The temperature and disk usage change slowly, only sample them every few seconds
+TEMP_SAMPLE_PERIOD = 5.0
+DISK_SAMPLE_PERIOD = 60.0
+temp_sample_time = disk_sample_time = float('-inf')
+
 frame_num = 0
 frame_times = []
 cpu_load = []
 use_debug_port = False
+primary_url: Optional[str] # either may be the debug url, which is None if a port was specified
+secondary_url: Optional[str]
+primary_name: Optional[str]
+secondary_name: Optional[str]
 disp_start_time = time.time()
 _sleep_timer = time.time()
 while frame_num < 10 and run:
@@ -461,12 +679,48 @@ while frame_num < 10 and run:
 
   log.debug(f'Active screen = {_active_screen}')
   if _active_screen == 0:
-    # Get AmpliPi status
+    image, draw = images[back_buffer], draws[back_buffer]
+
+    # Request the AmpliPi status in the background while the system stats are gathered
     if use_debug_port:
       primary_url, secondary_url = API_URL_DEBUG, API_URL
+      primary_name, secondary_name = API_NAME_DEBUG, API_NAME
     else:
       primary_url, secondary_url = API_URL, API_URL_DEBUG
-    primary_success, _sources, _zones = get_amplipi_data(primary_url)
+      primary_name, secondary_name = API_NAME, API_NAME_DEBUG
+    status_req = _status_pool.submit(get_amplipi_data, primary_url)
+
+    # Get stats
+    try:
+      ip_str = ni.ifaddresses(args.iface)[ni.AF_INET][0]['addr'] + ', ' + socket.gethostname() + '.local'
+    except:
+      ip_str = 'Disconnected'
+
+    cpu_pcnt = psutil.cpu_percent()
+    if frame_start_time - temp_sample_time >= TEMP_SAMPLE_PERIOD:
+      cpu_temp = psutil.sensors_temperatures()['cpu_thermal'][0].current
+      temp_sample_time = frame_start_time
+    cpu_str1 = f'{cpu_pcnt:4.1f}%'
+    cpu_str2 = f'{cpu_temp:4.1f}\xb0C'
+    cpu_load.append(cpu_pcnt)
+
+    vm = psutil.virtual_memory()
+    ram_total = vm.total >> 20
+    ram_used  = vm.used >> 20
+    ram_pcnt = 100 * ram_used / ram_total
+    ram_str1 = f'{ram_pcnt:4.1f}%'
+    ram_str2 = f'{ram_used}/{ram_total} MB'
+
+    if frame_start_time - disk_sample_time >= DISK_SAMPLE_PERIOD:
+      disk_usage = psutil.disk_usage('/')
+      disk_sample_time = frame_start_time
+    disk_pcnt = disk_usage.percent
+    disk_used = disk_usage.used / (1024**3)
+    disk_total = disk_usage.total / (1024**3)
+    disk_str1 = f'{disk_pcnt:4.1f}%'
+    disk_str2 = f'{disk_used:.2f}/{disk_total:.2f} GB'
+
+    primary_success, _sources, _zones = status_req.result()
     if primary_success:
       sources = _sources
       zones = _zones
@@ -476,81 +730,51 @@ while frame_num < 10 and run:
         sources = _sources
         zones = _zones
         use_debug_port = not use_debug_port
-        log.warning(f"Couldn't connect at {primary_url} but got a connection at {secondary_url}, switching over")
+        log.warning(f"Couldn't connect at {primary_name} but got a connection at {secondary_name}, switching over")
 
     if not primary_success and not secondary_success:
       connection_retries += 1
       if not connected_once:
         if connection_retries == 1:
-          log.info(f"Waiting for REST API to start at {primary_url}")
+          log.info(f"Waiting for REST API to start at {primary_name}")
         elif connection_retries == max_connection_retries:
-          log.error(f"Couldn't connect to REST API at {primary_url}")
+          log.error(f"Couldn't connect to REST API at {primary_name}")
       elif connection_retries < max_connection_retries:
-        log.error(f'Failure communicating with REST API at {primary_url}')
+        log.error(f'Failure communicating with REST API at {primary_name}')
       elif connection_retries == max_connection_retries:
-        log.error(f'Lost connection to REST API at {primary_url}')
+        log.error(f'Lost connection to REST API at {primary_name}')
 
       if connection_retries >= max_connection_retries:
         connected = False
+      if connection_retries % max_connection_retries == 0:
+        # the AmpliPi's address may have changed (ie. a new DHCP lease), look it up again
+        API_URL, API_URL_DEBUG = resolve_api_urls()
     else:
       if not connected:
-        url = primary_url if primary_success else secondary_url
-        log.info(f'Connected to REST API at {url}')
+        name = primary_name if primary_success else secondary_name
+        log.info(f'Connected to REST API at {name}')
       connected = True
       connected_once = True
       connection_retries = 0
 
-    # Get stats
-    try:
-      ip_str = ni.ifaddresses(args.iface)[ni.AF_INET][0]['addr'] + ', ' + socket.gethostname() + '.local'
-    except:
-      ip_str = 'Disconnected'
-
-    cpu_pcnt = psutil.cpu_percent()
-    cpu_temp = psutil.sensors_temperatures()['cpu_thermal'][0].current
-    cpu_str1 = f'{cpu_pcnt:4.1f}%'
-    cpu_str2 = f'{cpu_temp:4.1f}\xb0C'
-    cpu_load.append(cpu_pcnt)
-
-    ram_total = int(psutil.virtual_memory().total / (1024*1024))
-    ram_used  = int(psutil.virtual_memory().used / (1024*1024))
-    ram_pcnt = 100 * ram_used / ram_total
-    ram_str1 = f'{ram_pcnt:4.1f}%'
-    ram_str2 = f'{ram_used}/{ram_total} MB'
-
-    disk_usage  = psutil.disk_usage('/')
-    disk_pcnt = disk_usage.percent
-    disk_used = disk_usage.used / (1024**3)
-    disk_total = disk_usage.total / (1024**3)
-    disk_str1 = f'{disk_pcnt:4.1f}%'
-    disk_str2 = f'{disk_used:.2f}/{disk_total:.2f} GB'
-
     # Render text
-    cw = 8    # Character width
-    ch = 16   # Character height
     draw.rectangle((0, 0, width-1, height-1), fill=0) # Clear image
-    draw.text((1*cw, 0*ch + 2), 'CPU:',     font=font, fill='#FFFFFF')
-    draw.text((1*cw, 1*ch + 2), 'Mem:',     font=font, fill='#FFFFFF')
-    draw.text((1*cw, 2*ch + 2), 'Disk:',    font=font, fill='#FFFFFF')
-    draw.text((1*cw, 3*ch + 2), 'IP:',      font=font, fill='#FFFFFF')
-
-    draw.text((7*cw, 0*ch + 2), cpu_str1,   font=font, fill=gradient(cpu_pcnt))
-    draw.text((7*cw, 1*ch + 2), ram_str1,   font=font, fill=gradient(ram_pcnt))
-    draw.text((7*cw, 2*ch + 2), disk_str1,  font=font, fill=gradient(disk_pcnt))
+    draw.bitmap((0, 0), stat_labels, fill='#FFFFFF')
+
+    draw_glyphs(draw, (7*cw, 0*ch + 2), cpu_str1, font, gradient(cpu_pcnt))
+    draw_glyphs(draw, (7*cw, 1*ch + 2), ram_str1, font, gradient(ram_pcnt))
+    draw_glyphs(draw, (7*cw, 2*ch + 2), disk_str1, font, gradient(disk_pcnt))
     draw.text((7*cw, 3*ch + 2), ip_str,     font=font, fill='#FFFFFF')
 
     # BCM2837B0 is rated for [-40, 85] C
     # For now show green for anything below room temp
-    draw.text((14*cw, 0*ch + 2), cpu_str2,  font=font, fill=gradient(cpu_temp, min_val=20, max_val=85))
-    draw.text((14*cw, 1*ch + 2), ram_str2,  font=font, fill='#FFFFFF')
-    draw.text((14*cw, 2*ch + 2), disk_str2, font=font, fill='#FFFFFF')
+    draw_glyphs(draw, (14*cw, 0*ch + 2), cpu_str2, font, gradient(cpu_temp, min_val=20, max_val=85))
+    draw_glyphs(draw, (14*cw, 1*ch + 2), ram_str2, font, '#FFFFFF')
+    draw_glyphs(draw, (14*cw, 2*ch + 2), disk_str2, font, '#FFFFFF')
 
     if connected:
       # Show source input names
-      draw.text((1*cw, int(4.5*ch)), 'Source 1:',font=font, fill='#FFFFFF')
-      draw.text((1*cw, int(5.5*ch)), 'Source 2:',font=font, fill='#FFFFFF')
-      draw.text((1*cw, int(6.5*ch)), 'Source 3:',font=font, fill='#FFFFFF')
-      draw.text((1*cw, int(7.5*ch)), 'Source 4:',font=font, fill='#FFFFFF')
+      draw.bitmap((0, 0), source_labels, fill='#FFFFFF')
       xs = 11*cw
       xp = xs - round(0.5*cw) # Shift playing arrow back a bit
       ys = 4*ch + round(0.5*ch)
@@ -564,15 +788,19 @@ while frame_num < 10 and run:
       draw.line(((cw, ys+4*ch+2), (width-2*cw, ys+4*ch+2)), width=2, fill='#999999')
 
       # Show volumes
-      # TODO: only update volume bars if a volume changed
-      draw_volume_bars(draw, font, small_font, zones, x=cw, y=9*ch-2, height=height-9*ch, width=width - 2*cw)
+      bars_key = tuple((z.name, z.vol, z.mute) for z in zones)
+      if bars_key != volume_bars_key:
+        volume_bars_draw.rectangle((0, 0, width-1, volume_bars.size[1]-1), fill=0)
+        draw_volume_bars(volume_bars_draw, font, small_font, zones, x=cw, y=0, height=height-9*ch, width=width - 2*cw)
+        volume_bars_key = bars_key
+      image.paste(volume_bars, (0, volume_bars_y))
     else:
       # Show an error message on the display, and the AmpliPi logo below
       if not connected_once and connection_retries <= max_connection_retries:
         msg = 'Connecting to the REST API' + '.'*connection_retries
         text_c = '#FFFFFF'
       else:
-        msg = 'Cannot connect to the REST API at\n' + API_URL
+        msg = 'Cannot connect to the REST API at\n' + API_NAME
         text_c = '#FF0000'
       text_y = (height - ap_logo.size[1] - 4*ch)//2 + 4*ch
       draw.text((width/2 - 1, text_y), msg, anchor='mm', align='center', font=font, fill=text_c)
@@ -583,12 +811,13 @@ while frame_num < 10 and run:
       log.debug('Clearing screen then sleeping')
       backlight(False)
       draw.rectangle((0, 0, width-1, height-1), fill='#000000')
-      display.image(image)
+      push_image(image)
       _active_screen = 1
     else:
       # Send the updated image to the display
-      display.image(image)
+      push_image(image)
       backlight(True)
+    back_buffer = 1 - back_buffer
   elif _active_screen == 1:
     # Sleeping, wait for touch to wake up
     log.debug('Sleeping...')
@@ -619,7 +848,9 @@ if profile:
 gpio.remove_event_detect(t_irq_pin.id)
 
 # Clear display on exit
-display.image(Image.new('RGB', (width, height)))
+if _display_push is not None:
+  _display_push.result()
+display_image(Image.new('RGB', (width, height)))
 backlight(False)
 
 if args.test_timeout > 0.0 and not _touch_test_passed:
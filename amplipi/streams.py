@@ -191,7 +191,7 @@ class AirPlay(BaseStream):
   def info(self) -> models.SourceInfo:
     src_config_folder = f'{utils.get_folder("config")}/srcs/{self.src}'
     loc = f'{src_config_folder}/currentSong'
-    source = models.SourceInfo(name=self.full_name(), state=self.state)
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state)
     source.img_url = 'static/imgs/shairport.png'
     try:
       with open(loc, 'r') as file:
@@ -283,7 +283,7 @@ class Spotify(BaseStream):
   def info(self) -> models.SourceInfo:
     src_config_folder = f'{utils.get_folder("config")}/srcs/{self.src}'
     loc = f'{src_config_folder}/currentSong'
-    source = models.SourceInfo(name=self.full_name(), state=self.state, img_url='static/imgs/spotify.png')
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state, img_url='static/imgs/spotify.png')
     try:
       with open(loc, 'r') as file:
         d = {}
@@ -411,7 +411,7 @@ class Pandora(BaseStream):
   def info(self) -> models.SourceInfo:
     src_config_folder = f'{utils.get_folder("config")}/srcs/{self.src}'
     loc = f'{src_config_folder}/.config/pianobar/currentSong'
-    source = models.SourceInfo(name=self.full_name(), state=self.state, img_url='static/imgs/pandora.png')
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state, img_url='static/imgs/pandora.png')
     try:
       with open(loc, 'r') as file:
         for line in file.readlines():
@@ -528,7 +528,7 @@ class DLNA(BaseStream):
   def info(self) -> models.SourceInfo:
     src_config_folder = f'{utils.get_folder("config")}/srcs/{self.src}'
     loc = f'{src_config_folder}/currentSong'
-    source = models.SourceInfo(name=self.full_name(), state=self.state, img_url='static/imgs/dlna.png')
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state, img_url='static/imgs/dlna.png')
     try:
       with open(loc, 'r') as file:
         for line in file.readlines():
@@ -605,7 +605,7 @@ class InternetRadio(BaseStream):
   def info(self) -> models.SourceInfo:
     src_config_folder = f"{utils.get_folder('config')}/srcs/{self.src}"
     loc = f'{src_config_folder}/currentSong'
-    source = models.SourceInfo(name=self.full_name(), state=self.state, img_url=self.logo)
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state, img_url=self.logo)
     try:
       with open(loc, 'r') as file:
         data = json.loads(file.read())
@@ -710,7 +710,7 @@ class Plexamp(BaseStream):
     self.proc = None
 
   def info(self) -> models.SourceInfo:
-    source = models.SourceInfo(name=self.full_name(), state=self.state, img_url='static/imgs/plexamp.png')
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state, img_url='static/imgs/plexamp.png')
     return source
 
 class FilePlayer(BaseStream):
@@ -774,7 +774,7 @@ class FilePlayer(BaseStream):
     self._disconnect()
 
   def info(self) -> models.SourceInfo:
-    source = models.SourceInfo(name=self.full_name(), state=self.state, img_url='static/imgs/plexamp.png')
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state, img_url='static/imgs/plexamp.png')
     return source
 
 class FMRadio(BaseStream):
@@ -836,7 +836,7 @@ class FMRadio(BaseStream):
     loc = f'{src_config_folder}/currentSong'
     if not self.logo:
       self.logo = "static/imgs/fmradio.png"
-    source = models.SourceInfo(name=self.full_name(), state=self.state, img_url=self.logo)
+    source = models.SourceInfo.model_construct(name=self.full_name(), state=self.state, img_url=self.logo)
     try:
       with open(loc, 'r') as file:
         data = json.loads(file.read())
@@ -873,7 +873,7 @@ def build_stream(stream: models.Stream, mock=False) -> AnyStream:
 
   we are waiting on Pydantic's implemenatation of discriminators to fully integrate streams into our model definitions
   """
-  args = stream.dict(exclude_none=True)
+  args = stream.model_dump(exclude_none=True)
   if stream.type == 'pandora':
     return Pandora(args['name'], args['user'], args['password'], station=args.get('station'), mock=mock)
   elif stream.type == 'shairport' or stream.type == 'airplay': # handle older configs
@@ -27,7 +27,7 @@ class Client:
 
   def load_config(self, cfg: models.Status) -> Optional[models.Status]:
     """ Load a configuration """
-    resp = requests.post(f'{self.url}/load', json=cfg.dict())
+    resp = requests.post(f'{self.url}/load', json=cfg.model_dump())
     if resp.ok:
       return models.Status(**resp.json())
     return None
@@ -39,7 +39,7 @@ class Client:
 
   def create_preset(self, pst: models.Preset) -> bool:
     """ Create a new preset configuration """
-    resp = requests.post(f'{self.url}/preset', json=pst.dict())
+    resp = requests.post(f'{self.url}/preset', json=pst.model_dump())
     return resp.ok
 
   def get_status(self) -> Optional[models.Status]:
@@ -51,7 +51,7 @@ class Client:
 
   def announce(self, announcement: models.Announcement) -> bool:
     """ Announce something """
-    return requests.post(f'{self.url}/announce', json=announcement.dict()).ok
+    return requests.post(f'{self.url}/announce', json=announcement.model_dump()).ok
 
   def available(self) -> bool:
     """ Check connection """
@@ -277,7 +277,7 @@ After=network.target
 [Service]
 Type=simple
 WorkingDirectory={directory}
-ExecStart=/usr/bin/authbind --deep {directory}/venv/bin/python -m uvicorn --host 0.0.0.0 --port 80 amplipi.asgi:application
+ExecStart=/usr/bin/authbind --deep {directory}/venv/bin/python -m uvicorn --host 0.0.0.0 --port 80 --loop uvloop --http httptools --no-access-log amplipi.asgi:application
 Restart=always
 
 [Install]
@@ -96,7 +96,7 @@ def use_tmpdir():
 
 def prune_state(state: amplipi.models.Status):
   """ Prune generated fields from system state to make comparable """
-  dstate = state.dict(exclude_none=True)
+  dstate = state.model_dump(exclude_none=True)
   for field in dstate['sources']:
     field.pop('info')
   dstate.pop('info')
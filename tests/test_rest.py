@@ -170,11 +170,69 @@ def test_base(client, path):
     assert path == '/api'
     assert '/api/' in rv.location
 
+def test_base_changes(client):
+  """ Change a zone's name and check that the status reflects the change """
+  jrv = status_copy(client)
+  assert find(jrv['zones'], 0)['name'] != 'patched-name'
+  rv = client.patch('/api/zones/0', json={'name': 'patched-name'})
+  assert rv.status_code == HTTPStatus.OK
+  jrv = status_copy(client)
+  assert find(jrv['zones'], 0)['name'] == 'patched-name'
+
+def test_zones_changes(client):
+  """ Change a zone's name and check that the zones reflect the change """
+  rv = client.get('/api/zones')
+  assert rv.status_code == HTTPStatus.OK
+  assert find(rv.json()['zones'], 0)['name'] != 'patched-name'
+  rv = client.patch('/api/zones/0', json={'name': 'patched-name'})
+  assert rv.status_code == HTTPStatus.OK
+  rv = client.get('/api/zones')
+  assert rv.status_code == HTTPStatus.OK
+  assert find(rv.json()['zones'], 0)['name'] == 'patched-name'
+
+def test_base_changes_no_echo(client):
+  """ Change a zone's name without getting the status back """
+  rv = client.patch('/api/zones/0?echo=false', json={'name': 'patched-name'})
+  assert rv.status_code == HTTPStatus.NO_CONTENT
+  assert not rv.content
+  jrv = status_copy(client)
+  assert find(jrv['zones'], 0)['name'] == 'patched-name'
+
+def test_status_compressed(client):
+  """ Check that the large status response is gzipped for clients that accept it """
+  rv = client.get('/api', headers={'Accept-Encoding': 'gzip'})
+  assert rv.status_code == HTTPStatus.OK
+  assert rv.headers['content-encoding'] == 'gzip'
+  assert rv.json()['zones'] # the client transparently decompresses it
+
+def test_status_etag(client):
+  """ Check that polling the status with its ETag skips the download until the status changes """
+  rv = client.get('/api')
+  assert rv.status_code == HTTPStatus.OK
+  etag = rv.headers['etag']
+  rv = client.get('/api', headers={'If-None-Match': etag})
+  assert rv.status_code == HTTPStatus.NOT_MODIFIED
+  assert not rv.content
+  rv = client.patch('/api/zones/0', json={'name': 'patched-name'})
+  assert rv.status_code == HTTPStatus.OK
+  rv = client.get('/api', headers={'If-None-Match': etag})
+  assert rv.status_code == HTTPStatus.OK
+  assert rv.headers['etag'] != etag
+  assert find(rv.json()['zones'], 0)['name'] == 'patched-name'
+
 def test_reset(client):
   """ Reset the firmware """
   rv = client.post('/api/reset')
   assert rv.status_code == HTTPStatus.OK
 
+def test_reset_keeps_changes(client):
+  """ Change a zone's name and check that it was saved and reloaded by a reset """
+  rv = client.patch('/api/zones/0', json={'name': 'saved-name'})
+  assert rv.status_code == HTTPStatus.OK
+  rv = client.post('/api/reset')
+  assert rv.status_code == HTTPStatus.OK
+  assert find(rv.json()['zones'], 0)['name'] == 'saved-name'
+
 def test_load_og_config(client):
   """ Reload the initial configuration """
   rv = client.post('/api/load', json=client.original_config)
@@ -190,12 +248,12 @@ def test_load_og_config(client):
 
 def test_load_null_config(client):
   """ Load with the basic default configuration """
-  rv = client.post('/api/load', json={'config': amplipi.models.Status().dict()})
+  rv = client.post('/api/load', json={'config': amplipi.models.Status().model_dump()})
   assert rv.status_code == HTTPStatus.OK
   if rv.status_code == HTTPStatus.OK:
     jrv = rv.json()
     assert jrv is not None
-    og_config = amplipi.models.Status().dict()
+    og_config = amplipi.models.Status().model_dump()
     for t in ['sources', 'streams', 'zones', 'groups', 'presets']:
       if t in og_config:
         assert len(jrv[t]) == len(og_config[t])
@@ -405,6 +463,21 @@ def test_patch_stream_rename(client, sid):
   assert s is not None
   assert s['name'] == 'patched-name'
 
+@pytest.mark.parametrize('sid', base_stream_ids())
+def test_get_patched_stream(client, sid):
+  """ Make sure getting a stream reflects changes to it """
+  rv = client.get('/api/streams/{}'.format(sid))
+  assert rv.status_code == HTTPStatus.OK
+  rv = client.patch('/api/streams/{}'.format(sid), json={'name': 'patched-name'})
+  assert rv.status_code == HTTPStatus.OK
+  rv = client.get('/api/streams/{}'.format(sid))
+  assert rv.status_code == HTTPStatus.OK
+  assert rv.json()['name'] == 'patched-name'
+  rv = client.delete('/api/streams/{}'.format(sid))
+  assert rv.status_code == HTTPStatus.OK
+  rv = client.get('/api/streams/{}'.format(sid))
+  assert rv.status_code == HTTPStatus.NOT_FOUND
+
 # /streams/{streamId} delete-stream
 @pytest.mark.parametrize('sid', base_stream_ids())
 def test_delete_stream(client, sid):